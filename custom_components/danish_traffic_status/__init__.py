@@ -1,24 +1,41 @@
 """The Danish Traffic Status integration."""
 import asyncio
 import logging
+import time
 from datetime import timedelta
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
 from homeassistant.const import CONF_NAME, CONF_SCAN_INTERVAL
 
 from .const import (
     DOMAIN,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_ALL_LINES,
+    DISCOVERED_LINE_EXPIRY,
+    CONF_ALL_LINES,
     CONF_TRAIN_LINES,
     CONF_METRO_LINES,
+    CONF_TRAIN_SCAN_INTERVAL,
+    CONF_METRO_SCAN_INTERVAL,
     DEFAULT_TRAIN_LINES,
     DEFAULT_METRO_LINES,
+    LINE_TYPE_TRAIN,
+    LINE_TYPE_METRO,
+    SERVICE_REFRESH,
+    REFRESH_DEBOUNCE,
+    REFRESH_MIN_INTERVAL,
+    ATTR_FEEDS,
+    ATTR_REFRESHED,
+    ATTR_LAST_UPDATE_SUCCESS,
+    ATTR_LAST_FETCH,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,8 +46,11 @@ CONFIG_SCHEMA = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
                 vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.positive_int,
+                vol.Optional(CONF_TRAIN_SCAN_INTERVAL): cv.positive_int,
+                vol.Optional(CONF_METRO_SCAN_INTERVAL): cv.positive_int,
                 vol.Optional(CONF_TRAIN_LINES, default=DEFAULT_TRAIN_LINES): cv.ensure_list,
                 vol.Optional(CONF_METRO_LINES, default=DEFAULT_METRO_LINES): cv.ensure_list,
+                vol.Optional(CONF_ALL_LINES, default=DEFAULT_ALL_LINES): cv.boolean,
             }
         )
     },
@@ -42,6 +62,38 @@ PLATFORMS = ["sensor"]
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Danish Traffic Status component."""
+
+    async def async_handle_refresh(call: ServiceCall):
+        """Refresh all feeds on demand and return the per-line status."""
+        coordinators = list(hass.data.get(DOMAIN, {}).values())
+        results = await asyncio.gather(
+            *[coordinator.async_refresh_now() for coordinator in coordinators]
+        )
+
+        response = {ATTR_FEEDS: {}}
+        for result in results:
+            for line_type, feed in result.pop(ATTR_FEEDS).items():
+                merged = response[ATTR_FEEDS].setdefault(line_type, feed)
+                # With several entries a feed is only reported fresh if it
+                # was refreshed for all of them
+                merged[ATTR_REFRESHED] = merged[ATTR_REFRESHED] and feed[ATTR_REFRESHED]
+                merged[ATTR_LAST_UPDATE_SUCCESS] = (
+                    merged[ATTR_LAST_UPDATE_SUCCESS] and feed[ATTR_LAST_UPDATE_SUCCESS]
+                )
+                merged[ATTR_LAST_FETCH] = min(
+                    merged[ATTR_LAST_FETCH] or "", feed[ATTR_LAST_FETCH] or ""
+                ) or None
+            for line_type, lines in result.items():
+                response.setdefault(line_type, {}).update(lines)
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_handle_refresh,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     if DOMAIN not in config:
         return True
 
@@ -81,84 +133,215 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     return unload_ok
 
 
-class DanishTrafficStatusDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Danish Traffic Status data."""
+class DanishTrafficStatusDataUpdateCoordinator:
+    """Aggregate of the independent train and metro coordinators.
+
+    Each feed is polled by its own coordinator with its own interval and
+    error state, so an outage in one feed does not affect the other. This
+    class only combines them to keep ``coordinator.data`` backward compatible.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
+        """Initialize the per-feed coordinators."""
+        self.hass = hass
+        self.entry = entry
+        self.train = TrainStatusDataUpdateCoordinator(hass, entry)
+        self.metro = MetroStatusDataUpdateCoordinator(hass, entry)
+        self._refresh_task = None
+
+    @property
+    def coordinators(self):
+        """Return the per-feed coordinators keyed by line type."""
+        return {
+            LINE_TYPE_TRAIN: self.train,
+            LINE_TYPE_METRO: self.metro,
+        }
+
+    @property
+    def train_lines(self):
+        """Return the configured train lines."""
+        return self.train.lines
+
+    @property
+    def metro_lines(self):
+        """Return the configured metro lines."""
+        return self.metro.lines
+
+    @property
+    def all_lines(self):
+        """Return True if all lines in the feeds are monitored."""
+        return self.entry.options.get(CONF_ALL_LINES, DEFAULT_ALL_LINES)
+
+    @property
+    def data(self):
+        """Return the combined data of all feeds."""
+        return {
+            line_type: coordinator.data or {}
+            for line_type, coordinator in self.coordinators.items()
+        }
+
+    @property
+    def last_update_success(self):
+        """Return True if the last update of every feed succeeded."""
+        return all(
+            coordinator.last_update_success
+            for coordinator in self.coordinators.values()
+        )
+
+    async def async_config_entry_first_refresh(self):
+        """Refresh all feeds for the first time.
+
+        A feed that fails is left to retry on its own interval. Setup is only
+        postponed if no feed could be fetched at all.
+        """
+        await asyncio.gather(
+            *[coordinator.async_refresh() for coordinator in self.coordinators.values()]
+        )
+
+        if not any(
+            coordinator.last_update_success
+            for coordinator in self.coordinators.values()
+        ):
+            raise ConfigEntryNotReady("Unable to fetch any traffic status data")
+
+    async def async_request_refresh(self):
+        """Request a refresh of all feeds."""
+        await asyncio.gather(
+            *[coordinator.async_request_refresh() for coordinator in self.coordinators.values()]
+        )
+
+    async def async_refresh_now(self):
+        """Refresh all feeds on demand and return the fresh data.
+
+        Concurrent callers share a single in-flight refresh. Besides the data
+        of each feed, the result holds whether each feed was refreshed.
+        """
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_task(self._async_refresh_now())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+
+        return await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh_now(self):
+        """Refresh the feeds that have not been fetched recently."""
+        # Let a burst of requests settle so they all share this refresh
+        await asyncio.sleep(REFRESH_DEBOUNCE)
+
+        now = dt_util.utcnow()
+        due = [
+            coordinator
+            for coordinator in self.coordinators.values()
+            if coordinator.last_fetch is None
+            or now - coordinator.last_fetch >= timedelta(seconds=REFRESH_MIN_INTERVAL)
+        ]
+        await asyncio.gather(*[coordinator.async_refresh() for coordinator in due])
+
+        result = self.data
+        result[ATTR_FEEDS] = {
+            line_type: {
+                ATTR_REFRESHED: coordinator in due and coordinator.last_update_success,
+                ATTR_LAST_UPDATE_SUCCESS: coordinator.last_update_success,
+                ATTR_LAST_FETCH: (
+                    coordinator.last_fetch.isoformat() if coordinator.last_fetch else None
+                ),
+            }
+            for line_type, coordinator in self.coordinators.items()
+        }
+        return result
+
+    def _clear_refresh_task(self, task):
+        """Allow a new refresh once the in-flight refresh has finished."""
+        self._refresh_task = None
+
+
+class TrafficStatusDataUpdateCoordinator(DataUpdateCoordinator):
+    """Base class to manage fetching status data for a single feed."""
+
+    line_type = None
+    lines_option = None
+    default_lines = None
+    scan_interval_option = None
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         """Initialize the data update coordinator."""
         self.entry = entry
-        self.train_lines = entry.options.get(CONF_TRAIN_LINES, DEFAULT_TRAIN_LINES)
-        self.metro_lines = entry.options.get(CONF_METRO_LINES, DEFAULT_METRO_LINES)
-        self.train_status = {}
-        self.metro_status = {}
+        self.lines = entry.options.get(self.lines_option, self.default_lines)
+        self.all_lines = entry.options.get(CONF_ALL_LINES, DEFAULT_ALL_LINES)
+        self.status = {}
+        self.discovered_lines = {}
+        self.last_fetch = None
         
         scan_interval = timedelta(
-            minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            minutes=entry.options.get(
+                self.scan_interval_option,
+                entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            )
         )
         
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
+            name=f"{DOMAIN}_{self.line_type}",
             update_interval=scan_interval,
         )
 
     async def _async_update_data(self):
         """Fetch data from API."""
+        # Record every attempt, so a failing feed is not fetched again on demand
+        # before the minimum refresh interval has passed
+        self.last_fetch = dt_util.utcnow()
+        
         try:
-            from .traffic_status import TrainStatusService, MetroStatusService
-            
-            train_service = TrainStatusService()
-            metro_service = MetroStatusService()
-            
-            train_data = {}
-            metro_data = {}
+            service = self._create_service()
             
-            # Fetch train status for each configured line
-            for line in self.train_lines:
-                train_status = await self.hass.async_add_executor_job(
-                    train_service.get_status, line
+            if self.all_lines:
+                # Drop discovered lines that have not been mentioned recently
+                now = time.monotonic()
+                self.discovered_lines = {
+                    line: last_seen
+                    for line, last_seen in self.discovered_lines.items()
+                    if now - last_seen < DISCOVERED_LINE_EXPIRY * 60
+                }
+                
+                # Fetch the feed once for the configured and discovered lines,
+                # picking up any new lines found in the feed
+                lines = list(self.lines)
+                lines.extend(line for line in self.discovered_lines if line not in lines)
+                data = await self.hass.async_add_executor_job(
+                    service.get_all_statuses, lines
                 )
-                train_data[line] = train_status
-            
-            # Fetch metro status for each configured line
-            for line in self.metro_lines:
-                metro_status = await self.hass.async_add_executor_job(
-                    metro_service.get_status, line
+                
+                for line, status in data.items():
+                    if status and line not in self.lines:
+                        self.discovered_lines[line] = now
+            else:
+                # Fetch the feed once for all configured lines
+                data = await self.hass.async_add_executor_job(
+                    service.get_statuses, self.lines
                 )
-                metro_data[line] = metro_status
             
             # Check for changes and send notifications
-            for line, status in train_data.items():
-                if line in self.train_status and self.train_status[line] != status:
-                    if status and status.get("url") != self.train_status[line].get("url"):
-                        self._notify_status_change(
-                            f"Line {line} changes",
-                            status.get("body", "No changes"),
-                            status.get("url", "")
-                        )
-            
-            for line, status in metro_data.items():
-                if line in self.metro_status and self.metro_status[line] != status:
-                    if status and status.get("name") != self.metro_status[line].get("name"):
-                        self._notify_status_change(
-                            status.get("type", "Metro status"),
-                            status.get("name", ""),
-                            ""
-                        )
+            for line, status in data.items():
+                if line in self.status and self.status[line] != status:
+                    if status:
+                        self._check_status_change(line, status, self.status[line] or {})
             
             # Update stored status
-            self.train_status = train_data
-            self.metro_status = metro_data
+            self.status = data
             
-            return {
-                "train": train_data,
-                "metro": metro_data,
-            }
+            return data
             
         except Exception as err:
-            _LOGGER.error("Error fetching traffic status data: %s", err)
-            raise UpdateFailed(f"Error fetching traffic status data: {err}")
+            _LOGGER.error("Error fetching %s status data: %s", self.line_type, err)
+            raise UpdateFailed(f"Error fetching {self.line_type} status data: {err}")
+
+    def _create_service(self):
+        """Create the service used to fetch status data."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _check_status_change(self, line, status, previous_status):
+        """Send a notification if the status of a line has changed."""
+        raise NotImplementedError("Subclasses must implement this method")
     
     def _notify_status_change(self, title, message, url=""):
         """Send notification through Home Assistant."""
@@ -171,3 +354,51 @@ class DanishTrafficStatusDataUpdateCoordinator(DataUpdateCoordinator):
                 "data": {"url": url} if url else {},
             },
         )
+
+
+class TrainStatusDataUpdateCoordinator(TrafficStatusDataUpdateCoordinator):
+    """Class to manage fetching train status data."""
+
+    line_type = LINE_TYPE_TRAIN
+    lines_option = CONF_TRAIN_LINES
+    default_lines = DEFAULT_TRAIN_LINES
+    scan_interval_option = CONF_TRAIN_SCAN_INTERVAL
+
+    def _create_service(self):
+        """Create the service used to fetch train status data."""
+        from .traffic_status import TrainStatusService
+        
+        return TrainStatusService()
+
+    def _check_status_change(self, line, status, previous_status):
+        """Send a notification if the train status message has changed."""
+        if status.get("url") != previous_status.get("url"):
+            self._notify_status_change(
+                f"Line {line} changes",
+                status.get("body", "No changes"),
+                status.get("url", "")
+            )
+
+
+class MetroStatusDataUpdateCoordinator(TrafficStatusDataUpdateCoordinator):
+    """Class to manage fetching metro status data."""
+
+    line_type = LINE_TYPE_METRO
+    lines_option = CONF_METRO_LINES
+    default_lines = DEFAULT_METRO_LINES
+    scan_interval_option = CONF_METRO_SCAN_INTERVAL
+
+    def _create_service(self):
+        """Create the service used to fetch metro status data."""
+        from .traffic_status import MetroStatusService
+        
+        return MetroStatusService()
+
+    def _check_status_change(self, line, status, previous_status):
+        """Send a notification if the metro status message has changed."""
+        if status.get("name") != previous_status.get("name"):
+            self._notify_status_change(
+                status.get("type", "Metro status"),
+                status.get("name", ""),
+                ""
+            )
@@ -10,8 +10,12 @@ from .const import (
     DOMAIN,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_ALL_LINES,
+    CONF_ALL_LINES,
     CONF_TRAIN_LINES,
     CONF_METRO_LINES,
+    CONF_TRAIN_SCAN_INTERVAL,
+    CONF_METRO_SCAN_INTERVAL,
     DEFAULT_TRAIN_LINES,
     DEFAULT_METRO_LINES,
 )
@@ -76,19 +80,38 @@ class DanishTrafficStatusOptionsFlowHandler(config_entries.OptionsFlow):
             train_lines = [line.strip() for line in user_input.get(CONF_TRAIN_LINES, "").split(",") if line.strip()]
             metro_lines = [line.strip() for line in user_input.get(CONF_METRO_LINES, "").split(",") if line.strip()]
             
-            return self.async_create_entry(
-                title="",
-                data={
-                    CONF_SCAN_INTERVAL: user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                    CONF_TRAIN_LINES: train_lines,
-                    CONF_METRO_LINES: metro_lines,
-                },
-            )
+            scan_interval = user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            
+            data = {
+                CONF_SCAN_INTERVAL: scan_interval,
+                CONF_TRAIN_LINES: train_lines,
+                CONF_METRO_LINES: metro_lines,
+                CONF_ALL_LINES: user_input.get(CONF_ALL_LINES, DEFAULT_ALL_LINES),
+            }
+            
+            # Only store per-feed intervals that override the update interval,
+            # so changing the update interval still applies to the other feeds
+            for option in (CONF_TRAIN_SCAN_INTERVAL, CONF_METRO_SCAN_INTERVAL):
+                feed_scan_interval = user_input.get(option, scan_interval)
+                if feed_scan_interval != scan_interval:
+                    data[option] = feed_scan_interval
+            
+            return self.async_create_entry(title="", data=data)
+
+        scan_interval = self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
         options = {
             vol.Optional(
                 CONF_SCAN_INTERVAL,
-                default=self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                default=scan_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=60)),
+            vol.Optional(
+                CONF_TRAIN_SCAN_INTERVAL,
+                default=self.config_entry.options.get(CONF_TRAIN_SCAN_INTERVAL, scan_interval),
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=60)),
+            vol.Optional(
+                CONF_METRO_SCAN_INTERVAL,
+                default=self.config_entry.options.get(CONF_METRO_SCAN_INTERVAL, scan_interval),
             ): vol.All(vol.Coerce(int), vol.Range(min=5, max=60)),
             vol.Optional(
                 CONF_TRAIN_LINES,
@@ -98,6 +121,10 @@ class DanishTrafficStatusOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_METRO_LINES,
                 default=", ".join(self.config_entry.options.get(CONF_METRO_LINES, DEFAULT_METRO_LINES)),
             ): str,
+            vol.Optional(
+                CONF_ALL_LINES,
+                default=self.config_entry.options.get(CONF_ALL_LINES, DEFAULT_ALL_LINES),
+            ): bool,
         }
 
         return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
@@ -6,12 +6,29 @@ DEFAULT_SCAN_INTERVAL = 15  # minutes
 
 CONF_TRAIN_LINES = "train_lines"
 CONF_METRO_LINES = "metro_lines"
+CONF_TRAIN_SCAN_INTERVAL = "train_scan_interval"
+CONF_METRO_SCAN_INTERVAL = "metro_scan_interval"
+CONF_ALL_LINES = "all_lines"
+
+LINE_TYPE_TRAIN = "train"
+LINE_TYPE_METRO = "metro"
 
 DEFAULT_TRAIN_LINES = ["C"]
 DEFAULT_METRO_LINES = ["M1/M2"]
+DEFAULT_ALL_LINES = False
+DISCOVERED_LINE_EXPIRY = 360  # minutes
+
+SERVICE_REFRESH = "refresh"
+REFRESH_DEBOUNCE = 2  # seconds
+REFRESH_MIN_INTERVAL = 60  # seconds
 
 ATTR_LINE = "line"
 ATTR_STATUS = "status"
 ATTR_LAST_UPDATED = "last_updated"
 ATTR_MESSAGE = "message"
 ATTR_URL = "url"
+ATTR_DISRUPTED_LINES = "disrupted_lines"
+ATTR_FEEDS = "feeds"
+ATTR_REFRESHED = "refreshed"
+ATTR_LAST_UPDATE_SUCCESS = "last_update_success"
+ATTR_LAST_FETCH = "last_fetch"
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -15,11 +15,40 @@ from .const import (
     ATTR_LAST_UPDATED,
     ATTR_MESSAGE,
     ATTR_URL,
+    ATTR_DISRUPTED_LINES,
+    LINE_TYPE_TRAIN,
+    LINE_TYPE_METRO,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def has_train_disruption(status_data):
+    """Check if there is a disruption based on train status data."""
+    return bool(status_data.get("body") and status_data.get("url"))
+
+
+def has_metro_disruption(status_data):
+    """Check if there is a disruption based on metro status data."""
+    return bool(status_data.get("name") and not status_data.get("isClearMessage", False))
+
+
+DISRUPTION_CHECKS = {
+    LINE_TYPE_TRAIN: has_train_disruption,
+    LINE_TYPE_METRO: has_metro_disruption,
+}
+
+
+def get_line_state(line_type, status_data):
+    """Return the state of a line from its status data."""
+    # Fetch errors mark the feed unavailable, so a line without status data
+    # simply has no active message
+    if not status_data:
+        return "normal"
+    
+    return "disruption" if DISRUPTION_CHECKS[line_type](status_data) else "normal"
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -28,19 +57,28 @@ async def async_setup_entry(
 
     entities = []
 
-    # Add train sensors
+    # In "all lines" mode a single entity covers every line in the feeds,
+    # per-line sensors are only created for the configured lines
+    if coordinator.all_lines:
+        entities.append(NetworkStatusSensor(coordinator))
+
+    # Add train sensors, backed by the train coordinator
     for line in coordinator.train_lines:
-        entities.append(TrainStatusSensor(coordinator, line))
+        entities.append(TrainStatusSensor(coordinator.train, line))
 
-    # Add metro sensors
+    # Add metro sensors, backed by the metro coordinator
     for line in coordinator.metro_lines:
-        entities.append(MetroStatusSensor(coordinator, line))
+        entities.append(MetroStatusSensor(coordinator.metro, line))
 
     async_add_entities(entities)
 
 
 class TrafficStatusSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Traffic Status sensor."""
+    """Representation of a Traffic Status sensor.
+
+    The coordinator is the per-feed coordinator for ``line_type``, so its
+    data maps line identifiers directly to status data.
+    """
 
     def __init__(self, coordinator, line, line_type):
         """Initialize the sensor."""
@@ -59,14 +97,10 @@ class TrafficStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return "unknown"
-        
-        status_data = self.coordinator.data.get(self._line_type, {}).get(self._line)
-        if not status_data:
+        if not self.coordinator.data or self._line not in self.coordinator.data:
             return "unknown"
         
-        return "normal" if not self._has_disruption(status_data) else "disruption"
+        return get_line_state(self._line_type, self.coordinator.data[self._line])
 
     @property
     def extra_state_attributes(self):
@@ -76,17 +110,13 @@ class TrafficStatusSensor(CoordinatorEntity, SensorEntity):
         }
         
         if self.coordinator.data:
-            status_data = self.coordinator.data.get(self._line_type, {}).get(self._line)
+            status_data = self.coordinator.data.get(self._line)
             if status_data:
                 attrs[ATTR_LAST_UPDATED] = datetime.now().isoformat()
                 attrs.update(self._get_attributes(status_data))
         
         return attrs
 
-    def _has_disruption(self, status_data):
-        """Check if there is a disruption based on status data."""
-        raise NotImplementedError("Subclasses must implement this method")
-
     def _get_attributes(self, status_data):
         """Get attributes from status data."""
         raise NotImplementedError("Subclasses must implement this method")
@@ -99,11 +129,6 @@ class TrainStatusSensor(TrafficStatusSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, line, "train")
 
-    def _has_disruption(self, status_data):
-        """Check if there is a disruption based on train status data."""
-        # Return False (no disruption) if status_data is empty or lacks disruption info
-        return bool(status_data.get("body") and status_data.get("url"))
-
     def _get_attributes(self, status_data):
         """Get attributes from train status data."""
         attrs = {}
@@ -127,11 +152,6 @@ class MetroStatusSensor(TrafficStatusSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, line, "metro")
 
-    def _has_disruption(self, status_data):
-        """Check if there is a disruption based on metro status data."""
-        # Return False (no disruption) if status_data is empty or lacks disruption info
-        return bool(status_data.get("name") and not status_data.get("isClearMessage", False))
-
     def _get_attributes(self, status_data):
         """Get attributes from metro status data."""
         attrs = {}
@@ -146,3 +166,61 @@ class MetroStatusSensor(TrafficStatusSensor):
             attrs["icon"] = status_data["icon"]
             
         return attrs
+
+
+class NetworkStatusSensor(SensorEntity):
+    """Representation of the status of all train and metro lines.
+
+    The state is the number of disrupted lines and the attributes hold a
+    compact map of the status of each line. The state is only written when
+    it has changed.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_network"
+        self._attr_name = "Network Status"
+        self._attr_icon = "mdi:transit-connection-variant"
+        self._attr_native_unit_of_measurement = "lines"
+        self._update_from_coordinator()
+
+    async def async_added_to_hass(self):
+        """Subscribe to updates of every feed."""
+        await super().async_added_to_hass()
+        for feed_coordinator in self.coordinator.coordinators.values():
+            self.async_on_remove(
+                feed_coordinator.async_add_listener(self._handle_coordinator_update)
+            )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from one of the feeds."""
+        previous = (self._attr_available, self._attr_extra_state_attributes)
+        self._update_from_coordinator()
+        if (self._attr_available, self._attr_extra_state_attributes) != previous:
+            self.async_write_ha_state()
+
+    def _update_from_coordinator(self):
+        """Update the state and attributes from the coordinator data."""
+        attrs = {}
+        disrupted = 0
+
+        for line_type, lines in self.coordinator.data.items():
+            line_states = {}
+            for line, status_data in lines.items():
+                line_states[line] = get_line_state(line_type, status_data)
+                if line_states[line] == "disruption":
+                    disrupted += 1
+            attrs[line_type] = line_states
+
+        attrs[ATTR_DISRUPTED_LINES] = disrupted
+        # Available as long as at least one feed is
+        self._attr_available = any(
+            feed_coordinator.last_update_success
+            for feed_coordinator in self.coordinator.coordinators.values()
+        )
+        self._attr_native_value = disrupted
+        self._attr_extra_state_attributes = attrs
@@ -2,68 +2,119 @@
 import logging
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 import requests
 
 _LOGGER = logging.getLogger(__name__)
 
+S_TRAIN_LINES = ["A", "B", "Bx", "C", "E", "F", "H"]
+
+# Matches line references such as "linje C" or "linjerne A, Bx og E" in
+# S-tog messages. Line names are matched case-sensitively so ordinary Danish
+# words such as "og" or "i" are never taken for a line.
+_LINE_NAME = "(?:%s)" % "|".join(sorted(S_TRAIN_LINES, key=len, reverse=True))
+LINE_PATTERN = re.compile(
+    r"\b[Ll]inj(?:e|er|erne)((?:(?:\s*,\s*|\s+og\s+|\s+)%s\b)+)" % _LINE_NAME
+)
+LINE_NAME_PATTERN = re.compile(r"\b%s\b" % _LINE_NAME)
+
 
 class TrainStatusService:
     """Service to fetch train status from DSB API."""
 
     BASE_URL = "https://www.dsb.dk/api/travelplans/gettrafficinfolist?lang=da"
 
-    def get_status(self, train_line):
-        """Get status for a specific train line."""
-        try:
-            response = requests.get(self.BASE_URL, timeout=10)
-            response.raise_for_status()
-            
-            train_status_messages = response.json()
-            
-            _LOGGER.debug("Train status messages: %s", train_status_messages)
-            # Filter active messages for the specified line
-            active_messages = [
-                msg for msg in train_status_messages
-                if msg.get("sender") == "S-tog" and
-                self._is_message_active(msg) and
-                self._is_message_for_line(msg, train_line)
-            ]
-            
-            # Prioritize urgent messages
-            urgent_messages = [msg for msg in active_messages if msg.get("urgent", False)]
-            if urgent_messages:
-                return self._format_message(urgent_messages[0])
-            
-            # Return first active message or None
-            return self._format_message(active_messages[0]) if active_messages else None
-            
-        except Exception as err:
-            _LOGGER.error("Error fetching train status: %s", err)
-            return None
+    def get_statuses(self, train_lines):
+        """Get status for the given train lines.
+
+        The feed is fetched only once. Errors are raised to the caller.
+        """
+        messages = self._fetch_messages()
+        
+        return {line: self._get_line_status(messages, line) for line in train_lines}
+
+    def get_all_statuses(self, train_lines=()):
+        """Get status for the given train lines and all lines found in the feed.
+
+        The feed is fetched only once. Errors are raised to the caller.
+        """
+        messages = self._fetch_messages()
+        
+        lines = list(train_lines)
+        known = {line.lower() for line in lines}
+        for line in self._discover_lines(messages):
+            if line.lower() not in known:
+                known.add(line.lower())
+                lines.append(line)
+        
+        return {line: self._get_line_status(messages, line) for line in lines}
+
+    def _fetch_messages(self):
+        """Fetch all active S-tog messages."""
+        response = requests.get(self.BASE_URL, timeout=10)
+        response.raise_for_status()
+        
+        train_status_messages = response.json()
+        
+        _LOGGER.debug("Train status messages: %s", train_status_messages)
+        return [
+            msg for msg in train_status_messages
+            if msg.get("sender") == "S-tog" and
+            self._is_message_active(msg)
+        ]
+
+    def _get_line_status(self, messages, train_line):
+        """Get status for a specific train line from the fetched messages."""
+        # Filter active messages for the specified line
+        active_messages = [
+            msg for msg in messages
+            if self._is_message_for_line(msg, train_line)
+        ]
+        
+        # Prioritize urgent messages
+        urgent_messages = [msg for msg in active_messages if msg.get("urgent", False)]
+        if urgent_messages:
+            return self._format_message(urgent_messages[0])
+        
+        # Return first active message or None
+        return self._format_message(active_messages[0]) if active_messages else None
+
+    def _discover_lines(self, messages):
+        """Find the train lines mentioned in the messages."""
+        lines = []
+        for msg in messages:
+            for line in self._get_message_lines(msg):
+                if line not in lines:
+                    lines.append(line)
+        return lines
+
+    def _get_message_lines(self, message):
+        """Get the train lines mentioned in a message."""
+        lines = []
+        for line_list in LINE_PATTERN.findall(message.get("body", "")):
+            for line in LINE_NAME_PATTERN.findall(line_list):
+                if line not in lines:
+                    lines.append(line)
+        return lines
     
     def _is_message_active(self, message):
         """Check if a message is currently active."""
-        now = datetime.now()
-        valid_from = datetime.fromisoformat(message.get("validFromDate").replace("Z", "+00:00")) if message.get("validFromDate") else None
-        valid_to = datetime.fromisoformat(message.get("validToDate").replace("Z", "+00:00")) if message.get("validToDate") else now + datetime.timedelta(hours=1)
+        now = datetime.now().astimezone()
+        valid_from = self._parse_date(message.get("validFromDate")) if message.get("validFromDate") else None
+        valid_to = self._parse_date(message.get("validToDate")) if message.get("validToDate") else now + timedelta(hours=1)
         
         return valid_from and valid_from <= now and valid_to >= now
+
+    def _parse_date(self, value):
+        """Parse an ISO date, treating dates without timezone as local time."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone()
     
     def _is_message_for_line(self, message, train_line):
         """Check if a message is for the specified train line."""
-        body = message.get("body", "").lower()
+        # Check if message mentions the line, using the same matching as
+        # line discovery so every discovered line has a status
         train_line = train_line.lower()
-        
-        # Check if message mentions the line
-        line_patterns = [
-            f"linje {train_line}",
-            f" {train_line},",
-            f" {train_line} ",
-            f" {train_line}."
-        ]
-        
-        if any(pattern in body for pattern in line_patterns):
+        if any(line.lower() == train_line for line in self._get_message_lines(message)):
             return True
         
         # Check if message is for all S-trains
@@ -91,26 +142,48 @@ class MetroStatusService:
 
     BASE_URL = "https://metroselskabet.euwest01.umbraco.io/api/operationData/GetOperationData/"
 
-    def get_status(self, metro_line):
-        """Get status for a specific metro line."""
-        try:
-            response = requests.get(self.BASE_URL, timeout=10)
-            response.raise_for_status()
-            
-            metro_status = response.json()
-            _LOGGER.debug("Metro status messages: %s", metro_status)
-            # Find active message for the specified line
-            active_messages = metro_status.get("activeMessages", [])
-            for message in active_messages:
-                line_setup = message.get("lineSetup", {})
-                if line_setup.get("lineGroup", "").strip() == metro_line:
-                    return self._format_message(message)
-            
-            return None
-            
-        except Exception as err:
-            _LOGGER.error("Error fetching metro status: %s", err)
-            return None
+    def get_statuses(self, metro_lines):
+        """Get status for the given metro lines.
+
+        The feed is fetched only once. Errors are raised to the caller.
+        """
+        messages = self._fetch_messages()
+        
+        return {line: self._get_line_status(messages, line) for line in metro_lines}
+
+    def get_all_statuses(self, metro_lines=()):
+        """Get status for the given metro lines and all lines found in the feed.
+
+        The feed is fetched only once. Errors are raised to the caller.
+        """
+        messages = self._fetch_messages()
+        
+        lines = list(metro_lines)
+        for message in messages:
+            line = message.get("lineSetup", {}).get("lineGroup", "").strip()
+            if line and line not in lines:
+                lines.append(line)
+        
+        return {line: self._get_line_status(messages, line) for line in lines}
+
+    def _fetch_messages(self):
+        """Fetch all active metro messages."""
+        response = requests.get(self.BASE_URL, timeout=10)
+        response.raise_for_status()
+        
+        metro_status = response.json()
+        _LOGGER.debug("Metro status messages: %s", metro_status)
+        return metro_status.get("activeMessages", [])
+
+    def _get_line_status(self, messages, metro_line):
+        """Get status for a specific metro line from the fetched messages."""
+        # Find active message for the specified line
+        for message in messages:
+            line_setup = message.get("lineSetup", {})
+            if line_setup.get("lineGroup", "").strip() == metro_line:
+                return self._format_message(message)
+        
+        return None
     
     def _format_message(self, message):
         """Format the message for Home Assistant."""
@@ -4,7 +4,9 @@ Test script for Danish Traffic Status APIs.
 This script tests the connection to the DSB and Metro APIs used by the component.
 """
 import argparse
+import importlib.util
 import json
+import os
 import sys
 from datetime import datetime
 import requests
@@ -89,25 +91,71 @@ def test_metro_api():
         return False
 
 
+def test_line_matching():
+    """Test that every discovered train line gets a status."""
+    print("\nTesting train line matching...")
+    
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "custom_components", "danish_traffic_status", "traffic_status.py",
+    )
+    spec = importlib.util.spec_from_file_location("traffic_status", path)
+    traffic_status = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(traffic_status)
+    
+    service = traffic_status.TrainStatusService()
+    cases = {
+        "Ingen tog på linjerne A og E": ["A", "E"],
+        "Ingen tog på linjerne A, Bx og E.": ["A", "Bx", "E"],
+        "Linje C kører med forsinkelser": ["C"],
+        "Togene kører på linje og til tiden i dag": [],
+    }
+    
+    success = True
+    for body, expected in cases.items():
+        messages = [{"body": body}]
+        lines = service._discover_lines(messages)
+        missing = [
+            line for line in lines
+            if service._get_line_status(messages, line) is None
+        ]
+        if lines != expected or missing:
+            print(f"Error: {body!r} gave lines {lines}, expected {expected}, "
+                  f"lines without status: {missing}")
+            success = False
+    
+    if success:
+        print(f"Success! All {len(cases)} messages matched the expected lines.")
+    
+    return success
+
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description="Test Danish Traffic Status APIs")
     parser.add_argument("--train", action="store_true", help="Test only the train API")
     parser.add_argument("--metro", action="store_true", help="Test only the metro API")
+    parser.add_argument("--lines", action="store_true", help="Test only the train line matching")
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
     
     args = parser.parse_args()
     
     success = True
     
-    if args.train or not (args.train or args.metro):
+    test_all = not (args.train or args.metro or args.lines)
+    
+    if args.train or test_all:
         train_success = test_train_api()
         success = success and train_success
     
-    if args.metro or not (args.train or args.metro):
+    if args.metro or test_all:
         metro_success = test_metro_api()
         success = success and metro_success
     
+    if args.lines or test_all:
+        lines_success = test_line_matching()
+        success = success and lines_success
+    
     print("\nTest Summary:")
     if success:
         print("✅ All tests passed! The APIs are accessible.")